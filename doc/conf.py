@@ -1,13 +1,13 @@
 # Sphinx configuration file
 
-import os
+import datetime
+import pathlib
 import sys
-import time
 
-sys.path.insert(0, os.path.abspath(".."))
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 
 project = "dnaio"
-copyright = f"{time.gmtime().tm_year} dnaio authors"
+copyright = f"{datetime.date.today().year} dnaio authors"
 author = "Marcel Martin"
 
 extensions = [
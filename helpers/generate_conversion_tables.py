@@ -1,6 +1,3 @@
-import io
-
-
 def nucleotide_complements_table():
     # A nice list of complements can be found at:
     # http://www.reverse-complement.com/ambiguity.html
@@ -39,26 +36,48 @@ def nucleotide_complements_table():
         # included above
     )
 
-    table = []
+    return [ord(complements.get(chr(i), chr(i))) for i in range(256)]
+
+
+def nucleotide_complements_literals(complements):
+    return [f"'{chr(c)}'" if c != i else i for i, c in enumerate(complements)]
+
+
+def nucleotide_complements_ssse3_tables(complements):
+    """
+    Build two 16-entry tables for complementing 16 nucleotides at once with
+    the SSSE3 pshufb instruction.
+
+    Only characters in the range 0x40-0x7F (letters) have a complement that
+    differs from the character itself. Because complementing preserves case,
+    c ^ complement(c) only depends on the five lowest bits of c. The first
+    table covers c & 0x1F in 0x00-0x0F, the second one 0x10-0x1F.
+    Both are indexed by the low nibble of c.
+    """
+    xor_tables = [[0] * 16, [0] * 16]
+    for i in range(0x40, 0x80):
+        xor_value = i ^ complements[i]
+        table = xor_tables[(i & 0x10) >> 4]
+        if i < 0x60:
+            table[i & 0x0F] = xor_value
+        # Lower case characters must produce the same values
+        assert table[i & 0x0F] == xor_value, chr(i)
+    # Verify that the vectorized approach gives the same result as the full
+    # table for every possible byte.
     for i in range(256):
-        c = chr(i)
-        if c in complements:
-            table.append(f"'{complements[c]}'")
-        else:
-            table.append(i)
-    return table
+        xor_value = 0
+        if i & 0xC0 == 0x40:
+            xor_value = xor_tables[(i & 0x10) >> 4][i & 0x0F]
+        assert i ^ xor_value == complements[i], i
+    return xor_tables
 
 
 def make_table(variable_name, table, columns=16):
-    out = io.StringIO()
-    out.write(variable_name + " = {")
-    for i, literal in enumerate(table):
-        if i % columns == 0:
-            out.write("\n    ")
-        out.write(f"{literal:3}, ")
-    out.write("\n")
-    out.write("};\n")
-    return out.getvalue()
+    rows = (
+        "    " + "".join(f"{literal:3}, " for literal in table[i : i + columns])
+        for i in range(0, len(table), columns)
+    )
+    return f"{variable_name} = {{\n" + "\n".join(rows) + "\n};\n"
 
 
 def main():
@@ -67,10 +86,26 @@ def main():
             "// This file is generated by generate_conversion_tables.py\n"
             "// Please do not edit manually.\n\n"
         )
+        complements = nucleotide_complements_table()
         out.write(
             make_table(
                 "static const char NUCLEOTIDE_COMPLEMENTS[256]",
-                nucleotide_complements_table(),
+                nucleotide_complements_literals(complements),
+            )
+        )
+        xor_low, xor_high = nucleotide_complements_ssse3_tables(complements)
+        out.write(
+            "\n// XOR values for complementing characters in 0x40-0x4F and 0x60-0x6F\n"
+        )
+        out.write(
+            make_table("static const char NUCLEOTIDE_COMPLEMENTS_XOR_LOW[16]", xor_low)
+        )
+        out.write(
+            "\n// XOR values for complementing characters in 0x50-0x5F and 0x70-0x7F\n"
+        )
+        out.write(
+            make_table(
+                "static const char NUCLEOTIDE_COMPLEMENTS_XOR_HIGH[16]", xor_high
             )
         )
 
@@ -32,8 +32,19 @@ __all__ = [
 ]
 
 import functools
+import warnings
 from os import PathLike
-from typing import Optional, Union, BinaryIO, Literal, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+    BinaryIO,
+    Literal,
+    overload,
+)
 
 from xopen import xopen
 
@@ -74,11 +85,39 @@ from .interfaces import (
 from .chunks import read_chunks, read_paired_chunks
 from ._version import version as __version__
 
+_FileOrPath = Union[str, PathLike, BinaryIO]
 
-# Backwards compatibility alias
-Sequence = SequenceRecord
 
-_FileOrPath = Union[str, PathLike, BinaryIO]
+# Function to use for opening the files, keyed by the number of files and
+# whether they are interleaved. Anything else is opened with _open_multiple.
+_OPEN_FUNCTIONS: Dict[Tuple[int, bool], Callable[..., Any]] = {
+    (1, False): _open_single,
+    (1, True): _open_paired,
+    (2, False): _open_paired,
+}
+
+
+def __getattr__(name: str):
+    if name == "Sequence":
+        # Backwards compatibility alias
+        warnings.warn(
+            "dnaio.Sequence is deprecated, use dnaio.SequenceRecord instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return SequenceRecord
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=8)
+def _xopen_partial(threads: int, compresslevel: int):
+    """
+    Return xopen with the threads and compresslevel arguments bound.
+
+    The result is cached so that repeated calls to `open` with the same
+    settings do not each create a new partial object.
+    """
+    return functools.partial(xopen, threads=threads, compresslevel=compresslevel)
 
 
 @overload
@@ -281,27 +320,30 @@ def open(
         this parameter. This parameter does not work when a custom opener is
         set.
     """
-    if files and (file1 is not None) and (file2 is not None):
-        raise ValueError(
-            "file1 and file2 arguments cannot be used together with files specified "
-            "as positional arguments"
-        )
-    elif files and (file1 is not None):
-        raise ValueError(
-            "The file1 keyword argument cannot be used together with files specified "
-            "as positional arguments"
-        )
-    elif len(files) > 1 and file2 is not None:
-        raise ValueError(
-            "The file2 argument cannot be used together with more than one "
-            "file specified as positional argument"
-        )
-    elif file1 is not None and file2 is not None:
-        files = (file1, file2)
-    elif file1 is not None:
-        files = (file1,)
-    elif len(files) == 1 and file2 is not None:
-        files = (files[0], file2)
+    if file1 is not None or file2 is not None:
+        # Deprecated keyword arguments; most callers pass files positionally
+        # and skip these checks entirely.
+        if files and (file1 is not None) and (file2 is not None):
+            raise ValueError(
+                "file1 and file2 arguments cannot be used together with files specified "
+                "as positional arguments"
+            )
+        elif files and (file1 is not None):
+            raise ValueError(
+                "The file1 keyword argument cannot be used together with files specified "
+                "as positional arguments"
+            )
+        elif len(files) > 1 and file2 is not None:
+            raise ValueError(
+                "The file2 argument cannot be used together with more than one "
+                "file specified as positional argument"
+            )
+        elif file1 is not None and file2 is not None:
+            files = (file1, file2)
+        elif file1 is not None:
+            files = (file1,)
+        elif len(files) == 1 and file2 is not None:
+            files = (files[0], file2)
 
     del file1
     del file2
@@ -311,28 +353,13 @@ def open(
     elif mode not in ("r", "w", "a"):
         raise ValueError("Mode must be 'r', 'w' or 'a'")
 
-    if opener == xopen:
-        opener = functools.partial(
-            xopen, threads=open_threads, compresslevel=compression_level
-        )
-    if interleaved or len(files) == 2:
-        return _open_paired(
-            *files,
-            opener=opener,
-            fileformat=fileformat,
-            mode=mode,
-            qualities=qualities,
-        )
-    elif len(files) > 2:
-        return _open_multiple(
-            *files, fileformat=fileformat, mode=mode, qualities=qualities, opener=opener
-        )
-
-    else:
-        return _open_single(
-            files[0],
-            opener=opener,
-            fileformat=fileformat,
-            mode=mode,
-            qualities=qualities,
-        )
+    if opener is xopen:
+        opener = _xopen_partial(open_threads, compression_level)
+    open_function = _OPEN_FUNCTIONS.get((len(files), bool(interleaved)), _open_multiple)
+    return open_function(
+        *files,
+        opener=opener,
+        fileformat=fileformat,
+        mode=mode,
+        qualities=qualities,
+    )
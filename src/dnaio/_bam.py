@@ -1,6 +1,8 @@
 import struct
 from io import BufferedIOBase
 
+_UINT32 = struct.Struct("<I")
+
 
 def read_bam_header(fileobj: BufferedIOBase) -> bytes:
     magic = fileobj.read(4)
@@ -22,22 +24,30 @@ def read_bam_header_after_magic(fileobj: BufferedIOBase) -> bytes:
     header_size = fileobj.read(4)
     if len(header_size) < 4:
         raise EOFError("Truncated BAM file")
-    (l_text,) = struct.unpack("<I", header_size)
+    (l_text,) = _UINT32.unpack(header_size)
     header = fileobj.read(l_text)
     if len(header) < l_text:
         raise EOFError("Truncated BAM file")
     n_ref_obj = fileobj.read(4)
     if len(n_ref_obj) < 4:
         raise EOFError("Truncated BAM file")
-    (n_ref,) = struct.unpack("<I", n_ref_obj)
-    for i in range(n_ref):
-        l_name_obj = fileobj.read(4)
-        if len(l_name_obj) < 4:
-            raise EOFError("Truncated BAM file")
-        (l_name,) = struct.unpack("<I", l_name_obj)
-        reference_chunk_size = l_name + 4  # Include name and uint32_t of size
+    (n_ref,) = _UINT32.unpack(n_ref_obj)
+    if n_ref == 0:
+        return header
+    l_name_obj = fileobj.read(4)
+    if len(l_name_obj) < 4:
+        raise EOFError("Truncated BAM file")
+    (l_name,) = _UINT32.unpack(l_name_obj)
+    for i in range(n_ref - 1):
+        # Include name, uint32_t of size and the l_name of the next reference
+        reference_chunk_size = l_name + 8
         reference_chunk = fileobj.read(reference_chunk_size)
         if len(reference_chunk) < reference_chunk_size:
             raise EOFError("Truncated BAM file")
+        (l_name,) = _UINT32.unpack_from(reference_chunk, l_name + 4)
+    reference_chunk_size = l_name + 4  # Include name and uint32_t of size
+    reference_chunk = fileobj.read(reference_chunk_size)
+    if len(reference_chunk) < reference_chunk_size:
+        raise EOFError("Truncated BAM file")
     # Fileobj is now skipped ahead and at the start of the BAM records
     return header
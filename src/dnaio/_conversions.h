@@ -19,3 +19,13 @@ static const char NUCLEOTIDE_COMPLEMENTS[256] = {
     224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 
     240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 
 };
+
+// XOR values for complementing characters in 0x40-0x4F and 0x60-0x6F
+static const char NUCLEOTIDE_COMPLEMENTS_XOR_LOW[16] = {
+      0,  21,  20,   4,  12,   0,   0,   4,  12,   0,   0,   6,   0,   6,   0,   0, 
+};
+
+// XOR values for complementing characters in 0x50-0x5F and 0x70-0x7F
+static const char NUCLEOTIDE_COMPLEMENTS_XOR_HIGH[16] = {
+      0,   0,  11,   0,  21,  20,  20,   0,   0,  11,   0,   0,   0,   0,   0,   0, 
+};
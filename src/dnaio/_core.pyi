@@ -4,6 +4,7 @@ from typing import (
     Optional,
     Tuple,
     BinaryIO,
+    Iterable,
     Iterator,
     Type,
     TypeVar,
@@ -37,7 +38,11 @@ class SequenceRecord:
 def paired_fastq_heads(
     buf1: ByteString, buf2: ByteString, end1: int, end2: int
 ) -> Tuple[int, int]: ...
-def bam_head(buf: bytes, end: Optional[int] = None) -> int: ...
+def paired_fasta_heads(
+    buf1: ByteString, buf2: ByteString, end1: int, end2: int
+) -> Tuple[int, int]: ...
+def fastq_head(buf: ByteString, end: Optional[int] = None) -> int: ...
+def bam_head(buf: ByteString, end: Optional[int] = None) -> int: ...
 def records_are_mates(
     __first_record: SequenceRecord,
     __second_record: SequenceRecord,
@@ -64,6 +69,16 @@ class BamIter:
     @property
     def number_of_records(self) -> int: ...
 
+class PairedIter:
+    def __init__(self, reader1: Iterable[T], reader2: Iterable[T]): ...
+    def __iter__(self) -> Iterator[Tuple[T, T]]: ...
+    def __next__(self) -> Tuple[T, T]: ...
+
+class InterleavedPairedIter:
+    def __init__(self, reader: Iterable[T]): ...
+    def __iter__(self) -> Iterator[Tuple[T, T]]: ...
+    def __next__(self) -> Tuple[T, T]: ...
+
 # Deprecated
 def record_names_match(header1: str, header2: str) -> bool: ...
 
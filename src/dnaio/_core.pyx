@@ -6,8 +6,8 @@ from cpython.mem cimport PyMem_Free, PyMem_Malloc, PyMem_Realloc
 from cpython.unicode cimport PyUnicode_CheckExact, PyUnicode_GET_LENGTH, PyUnicode_DecodeASCII
 from cpython.object cimport Py_TYPE, PyTypeObject
 from cpython.pyport cimport PY_SSIZE_T_MAX
-from cpython.ref cimport PyObject
-from cpython.tuple cimport PyTuple_GET_ITEM
+from cpython.ref cimport PyObject, Py_INCREF, Py_XDECREF, _Py_REFCNT
+from cpython.tuple cimport PyTuple_GET_ITEM, PyTuple_SET_ITEM
 from libc.string cimport memcmp, memcpy, memchr, strcspn, strspn, memmove
 from libc.stdint cimport uint8_t, uint16_t, uint32_t, int32_t
 
@@ -19,18 +19,21 @@ cdef extern from "Python.h":
     void *PyUnicode_DATA(object o)
     bint PyUnicode_IS_COMPACT_ASCII(object o)
     object PyUnicode_New(Py_ssize_t size, Py_UCS4 maxchar)
+    bint PyObject_GC_IsTracked(object o)
+    void PyObject_GC_Track(object o)
 
 cdef extern from "ascii_check.h":
     int string_is_ascii(char *string, size_t length)
 
-cdef extern from "_conversions.h":
-    const char NUCLEOTIDE_COMPLEMENTS[256]
+cdef extern from "reverse_complement.h":
+    void reverse_complement(char *dest, char *sequence, size_t length)
+    void reverse_string(char *dest, char *string, size_t length)
 
 cdef extern from "bam.h":
     void decode_bam_sequence(void *dest, void *encoded_sequence, size_t length)
     void decode_bam_qualities(uint8_t *dest, uint8_t *encoded_qualities, size_t length)
 
-from .exceptions import FastqFormatError
+from .exceptions import FastaFormatError, FastqFormatError, FileFormatError
 from ._util import shorten
 
 
@@ -88,6 +91,8 @@ cdef class SequenceRecord:
         object _qualities
         object _id
         object _comment
+        # Cached result of fastq_bytes(), reset when any field is changed
+        object _fastq_bytes
 
     def __init__(self, object name, object sequence, object qualities = None):
         if not PyUnicode_CheckExact(name):
@@ -111,6 +116,7 @@ cdef class SequenceRecord:
         self._name = name
         self._sequence = sequence
         self._qualities = qualities
+        self._fastq_bytes = None
 
     @property
     def name(self):
@@ -125,6 +131,7 @@ cdef class SequenceRecord:
         self._name = name
         self._id = None
         self._comment = None
+        self._fastq_bytes = None
 
     @property
     def sequence(self):
@@ -137,6 +144,7 @@ cdef class SequenceRecord:
         if not PyUnicode_IS_COMPACT_ASCII(sequence):
             raise ValueError(is_not_ascii_message("sequence", sequence))
         self._sequence = sequence
+        self._fastq_bytes = None
 
     @property
     def qualities(self):
@@ -155,6 +163,7 @@ cdef class SequenceRecord:
                 f"got {type(qualities)}."
             )
         self._qualities = qualities
+        self._fastq_bytes = None
 
     @property
     def id(self):
@@ -258,7 +267,13 @@ cdef class SequenceRecord:
 
         This is a faster version of ``record.qualities.encode('ascii')``.
         """
-        return self._qualities.encode('ascii')
+        if self._qualities is None:
+            raise ValueError("Cannot convert qualities to bytes when qualities is not set.")
+        # The qualities are guaranteed to be compact ASCII, so the internal
+        # representation can be copied as-is without going through a codec.
+        return PyBytes_FromStringAndSize(
+            <char *>PyUnicode_DATA(self._qualities),
+            PyUnicode_GET_LENGTH(self._qualities))
 
     def fastq_bytes(self, bint two_headers=False):
         """
@@ -274,6 +289,8 @@ cdef class SequenceRecord:
         """
         if self._qualities is None:
             raise ValueError("Cannot create a FASTQ record when qualities is not set.")
+        if not two_headers and self._fastq_bytes is not None:
+            return self._fastq_bytes
 
         cdef:
             char *name = <char *>PyUnicode_DATA(self._name)
@@ -312,6 +329,8 @@ cdef class SequenceRecord:
         memcpy(retval_ptr + cursor, qualities, qualities_length)
         cursor += qualities_length
         retval_ptr[cursor] = b"\n"
+        if not two_headers:
+            self._fastq_bytes = retval
         return retval
 
 
@@ -334,14 +353,7 @@ cdef class SequenceRecord:
         Returns:
             bool: Whether this and *other* are part of the same read pair.
         """
-        cdef:
-            char *header1_chars = <char *>PyUnicode_DATA(self._name)
-            char *header2_chars = <char *>PyUnicode_DATA(other._name)
-            size_t header2_length = <size_t>PyUnicode_GET_LENGTH(other._name)
-            size_t id1_length = strcspn(header1_chars, ' \t')
-            bint id1_ends_with_number = b'1' <= header1_chars[id1_length - 1] <= b'3'
-        return record_ids_match(header1_chars, header2_chars, id1_length,
-                                header2_length, id1_ends_with_number)
+        return sequence_records_are_mates(self, other)
 
     def reverse_complement(self):
         """
@@ -359,23 +371,14 @@ cdef class SequenceRecord:
             char *sequence = <char *>PyUnicode_DATA(self._sequence),
             char *reversed_qualities
             char *qualities
-            Py_ssize_t cursor, reverse_cursor
-            unsigned char nucleotide
             SequenceRecord seq_record
-        reverse_cursor = sequence_length
-        for cursor in range(sequence_length):
-            reverse_cursor -= 1
-            nucleotide = sequence[cursor]
-            reversed_sequence[reverse_cursor] = NUCLEOTIDE_COMPLEMENTS[nucleotide]
+        reverse_complement(reversed_sequence, sequence, sequence_length)
 
         if self._qualities is not None:
-            reverse_cursor = sequence_length
             reversed_qualities_obj = PyUnicode_New(sequence_length, 127)
             reversed_qualities = <char *>PyUnicode_DATA(reversed_qualities_obj)
             qualities = <char *>PyUnicode_DATA(self._qualities)
-            for cursor in range(sequence_length):
-                reverse_cursor -= 1
-                reversed_qualities[reverse_cursor] = qualities[cursor]
+            reverse_string(reversed_qualities, qualities, sequence_length)
         else:
             reversed_qualities_obj = None
         seq_record = SequenceRecord.__new__(SequenceRecord)
@@ -434,6 +437,125 @@ def paired_fastq_heads(buf1, buf2, Py_ssize_t end1, Py_ssize_t end2):
     return record_start1 - data1, record_start2 - data2
 
 
+cdef inline Py_ssize_t clamp_end(Py_ssize_t end, Py_ssize_t length):
+    """
+    Interpret end like the stop index of a slice of a buffer with the given
+    length and return a value between 0 and length.
+    """
+    if end < 0:
+        end += length
+        if end < 0:
+            return 0
+    return min(end, length)
+
+
+cdef inline char *next_fasta_record(char *pos, char *data, char *data_end):
+    """
+    Return a pointer to the next '>' at or after pos that directly follows
+    a newline, or NULL if there is none before data_end.
+    """
+    while True:
+        pos = <char *>memchr(pos, b'>', data_end - pos)
+        if pos == NULL or (pos != data and pos[-1] == b'\n'):
+            return pos
+        pos += 1
+
+
+def paired_fasta_heads(buf1, buf2, Py_ssize_t end1, Py_ssize_t end2):
+    """
+    Skip forward in the two buffers by the same number of FASTA records.
+
+    Returns:
+        A tuple (length1, length2) such that buf1[:length1] and
+        buf2[:length2] contain the same number of complete FASTA records.
+    """
+    # Acquire buffers. Cython automatically checks for errors here.
+    cdef Py_buffer data1_buffer
+    cdef Py_buffer data2_buffer
+    PyObject_GetBuffer(buf1, &data1_buffer, PyBUF_SIMPLE)
+    try:
+        PyObject_GetBuffer(buf2, &data2_buffer, PyBUF_SIMPLE)
+    except:
+        PyBuffer_Release(&data1_buffer)
+        raise
+
+    # Clamping ensures we do not read beyond the size of the buffer.
+    end1 = clamp_end(end1, data1_buffer.len)
+    end2 = clamp_end(end2, data2_buffer.len)
+    if end1 == 0 or end2 == 0:
+        PyBuffer_Release(&data1_buffer)
+        PyBuffer_Release(&data2_buffer)
+        return (0, 0)
+
+    cdef:
+        char *data1 = <char *>data1_buffer.buf
+        char *data2 = <char *>data2_buffer.buf
+        char *data1_end = data1 + end1
+        char *data2_end = data2 + end2
+        char *pos1 = data1
+        char *pos2 = data2
+        char *record_start1 = data1
+        char *record_start2 = data2
+
+    if data1[0] != b'>' or data2[0] != b'>':
+        PyBuffer_Release(&data1_buffer)
+        PyBuffer_Release(&data2_buffer)
+        raise FastaFormatError("FASTA file expected to start with '>'", line=None)
+
+    while True:
+        pos1 = next_fasta_record(pos1, data1, data1_end)
+        if pos1 == NULL:
+            break
+        pos2 = next_fasta_record(pos2, data2, data2_end)
+        if pos2 == NULL:
+            break
+        record_start1 = pos1
+        record_start2 = pos2
+        pos1 += 1
+        pos2 += 1
+
+    PyBuffer_Release(&data1_buffer)
+    PyBuffer_Release(&data2_buffer)
+    return record_start1 - data1, record_start2 - data2
+
+
+def fastq_head(buf, end = None):
+    """
+    Search for the end of the last complete *two* FASTQ records in buf[:end].
+
+    Two FASTQ records are required to ensure that read pairs in interleaved
+    paired-end data are not split.
+
+    Returns:
+        An integer length such that buf[:length] contains a number of lines
+        that is divisible by eight.
+    """
+    cdef Py_ssize_t c_end = PY_SSIZE_T_MAX
+    if end is not None:
+        c_end = end
+    cdef Py_buffer buffer
+    PyObject_GetBuffer(buf, &buffer, PyBUF_SIMPLE)
+    cdef:
+        Py_ssize_t linebreaks = 0
+        char *data = <char *>buffer.buf
+        char *data_end = data + clamp_end(c_end, buffer.len)
+        char *pos = data
+        char *record_start = data
+
+    while True:
+        pos = <char *>memchr(pos, b'\n', data_end - pos)
+        if pos == NULL:
+            break
+        pos += 1
+        linebreaks += 1
+        if linebreaks == 8:
+            linebreaks = 0
+            record_start = pos
+    cdef Py_ssize_t head = <Py_ssize_t>(record_start - data)
+    PyBuffer_Release(&buffer)
+    return head
+
+
 def bam_head(buf, end = None):
     """Return the end of the last complete BAM record in the buf."""
     cdef Py_ssize_t c_end = PY_SSIZE_T_MAX
@@ -925,6 +1047,18 @@ cdef inline bint record_ids_match(char *header1,
     return memcmp(<void *>header1, <void *>header2, id1_length) == 0
 
 
+cdef inline bint sequence_records_are_mates(SequenceRecord first,
+                                            SequenceRecord second):
+    cdef:
+        char *header1_chars = <char *>PyUnicode_DATA(first._name)
+        char *header2_chars = <char *>PyUnicode_DATA(second._name)
+        size_t header2_length = <size_t>PyUnicode_GET_LENGTH(second._name)
+        size_t id1_length = strcspn(header1_chars, ' \t')
+        bint id1_ends_with_number = b'1' <= header1_chars[id1_length - 1] <= b'3'
+    return record_ids_match(header1_chars, header2_chars, id1_length,
+                            header2_length, id1_ends_with_number)
+
+
 def records_are_mates(*args) -> bool:
     """
     Check if the provided `SequenceRecord` objects are all mates of each other by
@@ -982,3 +1116,125 @@ def records_are_mates(*args) -> bool:
         are_mates &= record_ids_match(first_name, other_name, id_length,
                                       other_name_length, id_ends_with_number)
     return are_mates
+
+
+cdef inline bint is_mate_of(object r1, object r2) except -1:
+    if (Py_TYPE(r1) == <PyTypeObject *>SequenceRecord and
+            Py_TYPE(r2) == <PyTypeObject *>SequenceRecord):
+        return sequence_records_are_mates(r1, r2)
+    return r1.is_mate(r2)
+
+
+cdef inline tuple make_pair(PyObject *previous_pair, object r1, object r2):
+    """
+    Return the tuple (r1, r2).
+
+    previous_pair is the tuple returned in the previous iteration (or None).
+    If the caller has released it (typically by unpacking it), it is filled
+    with the new records instead of allocating a new tuple. The same
+    optimization is used by the builtin zip().
+    """
+    cdef:
+        PyObject *old_r1
+        PyObject *old_r2
+    if previous_pair == <PyObject *>None or _Py_REFCNT(previous_pair) != 1:
+        return (r1, r2)
+    pair = <tuple>previous_pair
+    old_r1 = PyTuple_GET_ITEM(pair, 0)
+    old_r2 = PyTuple_GET_ITEM(pair, 1)
+    Py_INCREF(r1)
+    Py_INCREF(r2)
+    PyTuple_SET_ITEM(pair, 0, r1)
+    PyTuple_SET_ITEM(pair, 1, r2)
+    Py_XDECREF(old_r1)
+    Py_XDECREF(old_r2)
+    # The garbage collector untracks tuples that only contain untracked
+    # objects. It needs to track the tuple again as the content changed.
+    if not PyObject_GC_IsTracked(pair):
+        PyObject_GC_Track(pair)
+    return pair
+
+
+cdef class PairedIter:
+    """
+    Iterate over two readers in lockstep and yield tuples of mates.
+
+    This is the iteration loop of `TwoFilePairedEndReader`. Raises
+    `FileFormatError` if the record IDs do not match or if one of the readers
+    has more records than the other.
+    """
+    cdef:
+        object iter1
+        object iter2
+        tuple pair
+
+    def __cinit__(self, reader1, reader2):
+        self.iter1 = iter(reader1)
+        self.iter2 = iter(reader2)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        r1 = next(self.iter1, None)
+        r2 = next(self.iter2, None)
+        if r1 is None:
+            if r2 is None:
+                raise StopIteration()
+            raise FileFormatError(
+                "Reads are improperly paired. There are more reads in "
+                "file 2 than in file 1.",
+                line=None,
+            )
+        if r2 is None:
+            raise FileFormatError(
+                "Reads are improperly paired. There are more reads in "
+                "file 1 than in file 2.",
+                line=None,
+            )
+        if not is_mate_of(r1, r2):
+            raise FileFormatError(
+                f"Reads are improperly paired. Read name '{r1.name}' "
+                f"in file 1 does not match '{r2.name}' in file 2.",
+                line=None,
+            )
+        self.pair = make_pair(<PyObject *>self.pair, r1, r2)
+        return self.pair
+
+
+cdef class InterleavedPairedIter:
+    """
+    Iterate over a reader of interleaved paired-end data and yield tuples of
+    mates.
+
+    This is the iteration loop of `InterleavedPairedEndReader`. Raises
+    `FileFormatError` if the record IDs do not match or if the last record
+    has no mate.
+    """
+    cdef:
+        object iter
+        tuple pair
+
+    def __cinit__(self, reader):
+        self.iter = iter(reader)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        r1 = next(self.iter)
+        r2 = next(self.iter, None)
+        if r2 is None:
+            raise FileFormatError(
+                "Interleaved input file incomplete: Last record "
+                f"'{r1.name}' has no partner.",
+                line=None,
+            )
+        if not is_mate_of(r1, r2):
+            raise FileFormatError(
+                f"Reads are improperly paired. Name '{r1.name}' "
+                f"(first) does not match '{r2.name}' (second).",
+                line=None,
+            )
+        self.pair = make_pair(<PyObject *>self.pair, r1, r2)
+        return self.pair
@@ -1,5 +1,7 @@
-def shorten(s: str, n: int = 100) -> str:
+from typing import Optional
 
+
+def shorten(s: Optional[str], n: int = 100) -> Optional[str]:
     """Shorten string s to at most n characters, appending "..." if necessary."""
     if s is None:
         return None
@@ -1,27 +1,4 @@
-// Macros also used in htslib, very useful.
-#if defined __GNUC__
-#define GCC_AT_LEAST(major, minor) \
-    (__GNUC__ > (major) || (__GNUC__ == (major) && __GNUC_MINOR__ >= (minor)))
-#else 
-# define GCC_AT_LEAST(major, minor) 0
-#endif
-
-#if defined(__clang__) && defined(__has_attribute)
-#define CLANG_COMPILER_HAS(attribute) __has_attribute(attribute)
-#else
-#define CLANG_COMPILER_HAS(attribute) 0
-#endif
-
-#define COMPILER_HAS_TARGET (GCC_AT_LEAST(4, 8) || CLANG_COMPILER_HAS(__target__))
-#define COMPILER_HAS_CONSTRUCTOR (__GNUC__ || CLANG_COMPILER_HAS(constructor))
-#define COMPILER_HAS_OPTIMIZE (GCC_AT_LEAST(4,4) || CLANG_COMPILER_HAS(optimize))
-
-#if defined(__x86_64__) || defined(_M_X64)
-#define BUILD_IS_X86_64 1
-#include "immintrin.h"
-#else
-#define BUILD_IS_X86_64 0
-#endif
+#include "compiler.h"
 
 #include <stdint.h>
 #include <string.h>
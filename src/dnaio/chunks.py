@@ -7,15 +7,17 @@ or subprocess and be parsed and processed there.
 """
 
 from io import BufferedIOBase
-from typing import Optional, Iterator, Tuple
+from typing import Callable, Optional, Iterator, Tuple, Union
 
 from ._bam import read_bam_header_after_magic
+from ._core import fastq_head as _fastq_head
+from ._core import paired_fasta_heads as _paired_fasta_heads
 from ._core import paired_fastq_heads as _paired_fastq_heads
 from ._core import bam_head as _bam_head
 from .exceptions import FileFormatError, FastaFormatError, UnknownFileFormat
 
 
-def _fasta_head(buf: bytes, end: Optional[int] = None) -> int:
+def _fasta_head(buf: Union[bytes, bytearray], end: Optional[int] = None) -> int:
     """
     Search for the end of the last complete FASTA record within buf[:end]
 
@@ -36,51 +38,6 @@ def _fasta_head(buf: bytes, end: Optional[int] = None) -> int:
     )
 
 
-def _paired_fasta_heads(
-    buf1: bytes, buf2: bytes, end1: int, end2: int
-) -> Tuple[int, int]:
-    """
-    Return positions pos1, pos2 where right1 <= end1 and right2 <= end2
-    such that buf1[:pos1] and buf2[:pos2] contain the same number of complete FASTA
-    records.
-    """
-    if end1 == 0 or end2 == 0:
-        return (0, 0)
-
-    if (end1 > 0 and buf1[:1] != b">") or (end2 > 0 and buf2[:1] != b">"):
-        raise FastaFormatError("FASTA file expected to start with '>'", line=None)
-
-    # Count complete records
-    n_records1 = buf1.count(b"\n>", 0, end1)
-    n_records2 = buf2.count(b"\n>", 0, end2)
-    n_records = min(n_records1, n_records2)
-
-    pos1 = pos2 = 0
-    while n_records > 0:
-        pos1 = buf1.find(b"\n>", pos1, end1) + 1
-        pos2 = buf2.find(b"\n>", pos2, end2) + 1
-        n_records -= 1
-
-    return (pos1, pos2)
-
-
-def _fastq_head(buf: bytes, end: Optional[int] = None) -> int:
-    """
-    Search for the end of the last complete *two* FASTQ records in buf[:end].
-
-    Two FASTQ records are required to ensure that read pairs in interleaved
-    paired-end data are not split.
-    """
-    linebreaks = buf.count(b"\n", 0, end)
-    right = end
-    for _ in range(linebreaks % 8 + 1):
-        right = buf.rfind(b"\n", 0, right)
-    # Note that this works even if linebreaks == 0:
-    # rfind() returns -1 and adding 1 gives index 0,
-    # which is correct.
-    return right + 1  # type: ignore
-
-
 def read_chunks(
     f: BufferedIOBase, buffer_size: int = 4 * 1024**2
 ) -> Iterator[memoryview]:
@@ -105,14 +62,16 @@ def read_chunks(
     """
     # This buffer is re-used in each iteration.
     buf = bytearray(buffer_size)
+    view = memoryview(buf)
 
     # Read one byte to determine file format.
     # If there is a comment char, we assume FASTA!
-    start = f.readinto(memoryview(buf)[0:4])
+    start = f.readinto(view[0:4])
     if start == 0:
         # Empty file
         return
     assert start == 4
+    head: Callable[[bytearray, int], int]
     if buf[0:1] == b"@":
         head = _fastq_head
     elif buf[0:1] == b"#" or buf[0:1] == b">":
@@ -143,20 +102,20 @@ def read_chunks(
     while True:
         if start == len(buf):
             raise OverflowError("FASTA/FASTQ record does not fit into buffer")
-        bufend = f.readinto(memoryview(buf)[start:]) + start
+        bufend = f.readinto(view[start:]) + start
         if start == bufend:
             # End of file
             break
         end = head(buf, bufend)
         assert end <= bufend
         if end > 0:
-            yield memoryview(buf)[0:end]
+            yield view[0:end]
         start = bufend - end
         assert start >= 0
-        buf[0:start] = buf[end:bufend]
+        view[0:start] = view[end:bufend]
 
     if start > 0:
-        yield memoryview(buf)[0:start]
+        yield view[0:start]
 
 
 def read_paired_chunks(
@@ -191,10 +150,12 @@ def read_paired_chunks(
 
     buf1 = bytearray(buffer_size)
     buf2 = bytearray(buffer_size)
+    view1 = memoryview(buf1)
+    view2 = memoryview(buf2)
 
     # Read one byte to make sure we are processing FASTQ
-    start1 = f.readinto(memoryview(buf1)[0:1])
-    start2 = f2.readinto(memoryview(buf2)[0:1])
+    start1 = f.readinto(view1[0:1])
+    start2 = f2.readinto(view2[0:1])
 
     if start1 == 0 and start2 == 0:
         return
@@ -230,8 +191,8 @@ def read_paired_chunks(
             raise ValueError(
                 f"FASTA/FASTQ records do not fit into buffer of size {buffer_size}"
             )
-        bufend1 = f.readinto(memoryview(buf1)[start1:]) + start1
-        bufend2 = f2.readinto(memoryview(buf2)[start2:]) + start2
+        bufend1 = f.readinto(view1[start1:]) + start1
+        bufend2 = f2.readinto(view2[start2:]) + start2
         if start1 == bufend1 and start2 == bufend2:
             break
 
@@ -240,7 +201,7 @@ def read_paired_chunks(
         assert end2 <= bufend2
 
         if end1 > 0 or end2 > 0 or file_format == "FASTA":
-            yield (memoryview(buf1)[0:end1], memoryview(buf2)[0:end2])
+            yield (view1[0:end1], view2[0:end2])
         else:
             assert end1 == 0 and end2 == 0
             extra = ""
@@ -252,10 +213,10 @@ def read_paired_chunks(
             )
         start1 = bufend1 - end1
         assert start1 >= 0
-        buf1[0:start1] = buf1[end1:bufend1]
+        view1[0:start1] = view1[end1:bufend1]
         start2 = bufend2 - end2
         assert start2 >= 0
-        buf2[0:start2] = buf2[end2:bufend2]
+        view2[0:start2] = view2[end2:bufend2]
 
     if start1 > 0 or start2 > 0:
-        yield (memoryview(buf1)[0:start1], memoryview(buf2)[0:start2])
+        yield (view1[0:start1], view2[0:start2])
@@ -9,7 +9,7 @@ from ._core import SequenceRecord, records_are_mates
 from .exceptions import FileFormatError
 from .interfaces import MultipleFileWriter
 from .readers import FastaReader, FastqReader
-from .singleend import _open_single, _detect_format_from_name
+from .singleend import _check_output_format, _detect_format_from_name, _open_single
 from .writers import FastaWriter, FastqWriter
 
 
@@ -26,7 +26,9 @@ def _open_multiple(
         raise ValueError("Mode must be one of 'r', 'w', 'a'")
     elif mode == "r":
         return MultipleFileReader(*files, fileformat=fileformat, opener=opener)
-    elif mode == "w" and fileformat is None:
+    for file in files:
+        _check_output_format(file, fileformat)
+    if mode == "w" and fileformat is None:
         # Assume mixed files will not be offered.
         for file in files:
             if isinstance(file, (str, os.PathLike)):
@@ -1,15 +1,13 @@
-from contextlib import ExitStack
 from os import PathLike
 from typing import Union, BinaryIO, Optional, Iterator, Tuple
 
 from xopen import xopen
 
-from ._core import SequenceRecord
-from .exceptions import FileFormatError
+from ._core import SequenceRecord, InterleavedPairedIter, PairedIter
 from .interfaces import PairedEndReader, PairedEndWriter
-from .readers import FastaReader, FastqReader
+from .readers import BamReader, FastaReader, FastqReader
 from .writers import FastaWriter, FastqWriter
-from .singleend import _open_single
+from .singleend import _check_output_format, _open_single
 
 
 def _open_paired(
@@ -22,6 +20,9 @@ def _open_paired(
     """
     Open paired-end reads
     """
+    if mode != "r":
+        for file in files:
+            _check_output_format(file, fileformat)
     if len(files) == 2:
         if mode in "wa" and files[0] == files[1]:
             raise ValueError("The paired-end output files are identical")
@@ -73,14 +74,18 @@ class TwoFilePairedEndReader(PairedEndReader):
         opener=xopen,
     ):
         self.mode = mode
-        with ExitStack() as stack:
-            self.reader1 = stack.enter_context(
-                _open_single(file1, opener=opener, fileformat=fileformat, mode=mode)
-            )
-            self.reader2 = stack.enter_context(
-                _open_single(file2, opener=opener, fileformat=fileformat, mode=mode)
+        self.reader1: Union[BamReader, FastaReader, FastqReader]
+        self.reader2: Union[BamReader, FastaReader, FastqReader]
+        self.reader1 = _open_single(  # type: ignore
+            file1, opener=opener, fileformat=fileformat, mode=mode
+        )
+        try:
+            self.reader2 = _open_single(  # type: ignore
+                file2, opener=opener, fileformat=fileformat, mode=mode
             )
-            self._close = stack.pop_all().close
+        except BaseException:
+            self.reader1.close()
+            raise
         self.delivers_qualities = self.reader1.delivers_qualities
 
     def __repr__(self) -> str:
@@ -93,39 +98,13 @@ class TwoFilePairedEndReader(PairedEndReader):
 
         Raises a `FileFormatError` if reads are improperly paired.
         """
-        for r1, r2 in zip(self.reader1, self.reader2):
-            if not r1.is_mate(r2):
-                raise FileFormatError(
-                    f"Reads are improperly paired. Read name '{r1.name}' "
-                    f"in file 1 does not match '{r2.name}' in file 2.",
-                    line=None,
-                ) from None
-            yield r1, r2
-
-        # Force consumption of another read to test if iterators are out of sync.
-        try:
-            next(iter(self.reader1))
-        except StopIteration:
-            pass
-        try:
-            next(iter(self.reader2))
-        except StopIteration:
-            pass
-        if self.reader1.number_of_records < self.reader2.number_of_records:
-            raise FileFormatError(
-                "Reads are improperly paired. There are more reads in "
-                "file 2 than in file 1.",
-                line=None,
-            ) from None
-        if self.reader1.number_of_records > self.reader2.number_of_records:
-            raise FileFormatError(
-                "Reads are improperly paired. There are more reads in "
-                "file 1 than in file 2.",
-                line=None,
-            ) from None
+        return PairedIter(self.reader1, self.reader2)
 
     def close(self) -> None:
-        self._close()
+        try:
+            self.reader1.close()
+        finally:
+            self.reader2.close()
 
     def __enter__(self):
         return self
@@ -162,23 +141,13 @@ class InterleavedPairedEndReader(PairedEndReader):
         return f"{self.__class__.__name__}({self.reader})"
 
     def __iter__(self) -> Iterator[Tuple[SequenceRecord, SequenceRecord]]:
-        it = iter(self.reader)
-        for r1 in it:
-            try:
-                r2 = next(it)
-            except StopIteration:
-                raise FileFormatError(
-                    "Interleaved input file incomplete: Last record "
-                    f"'{r1.name}' has no partner.",
-                    line=None,
-                ) from None
-            if not r1.is_mate(r2):
-                raise FileFormatError(
-                    f"Reads are improperly paired. Name '{r1.name}' "
-                    f"(first) does not match '{r2.name}' (second).",
-                    line=None,
-                )
-            yield r1, r2
+        """
+        Iterate over the paired reads.
+        Each yielded item is a pair of `SequenceRecord` objects.
+
+        Raises a `FileFormatError` if reads are improperly paired.
+        """
+        return InterleavedPairedIter(self.reader)
 
     def close(self) -> None:
         self.reader.close()
@@ -209,28 +178,26 @@ class TwoFilePairedEndWriter(PairedEndWriter):
         append: bool = False,
     ):
         mode = "a" if append else "w"
-        with ExitStack() as stack:
-            self._writer1: Union[FastaWriter, FastqWriter]
-            self._writer2: Union[FastaWriter, FastqWriter]
-            self._writer1 = stack.enter_context(
-                _open_single(
-                    file1,
-                    opener=opener,
-                    fileformat=fileformat,
-                    mode=mode,
-                    qualities=qualities,
-                )
-            )
-            self._writer2 = stack.enter_context(
-                _open_single(
-                    file2,
-                    opener=opener,
-                    fileformat=fileformat,
-                    mode=mode,
-                    qualities=qualities,
-                )
+        self._writer1: Union[FastaWriter, FastqWriter]
+        self._writer2: Union[FastaWriter, FastqWriter]
+        self._writer1 = _open_single(  # type: ignore
+            file1,
+            opener=opener,
+            fileformat=fileformat,
+            mode=mode,
+            qualities=qualities,
+        )
+        try:
+            self._writer2 = _open_single(  # type: ignore
+                file2,
+                opener=opener,
+                fileformat=fileformat,
+                mode=mode,
+                qualities=qualities,
             )
-            self._close = stack.pop_all().close
+        except BaseException:
+            self._writer1.close()
+            raise
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self._writer1}, {self._writer2})"
@@ -240,7 +207,10 @@ class TwoFilePairedEndWriter(PairedEndWriter):
         self._writer2.write(read2)
 
     def close(self) -> None:
-        self._close()
+        try:
+            self._writer1.close()
+        finally:
+            self._writer2.close()
 
     def __enter__(self):
         # TODO do not allow this twice
@@ -273,6 +243,10 @@ class InterleavedPairedEndWriter(PairedEndWriter):
         )
         assert isinstance(writer, (FastaWriter, FastqWriter))  # only for Mypy
         self._writer = writer
+        if isinstance(writer, FastqWriter) and not writer._two_headers:
+            self._file = writer._file
+            # setattr avoids a complaint from Mypy
+            setattr(self, "write", self._write_fastq)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self._writer})"
@@ -281,6 +255,14 @@ class InterleavedPairedEndWriter(PairedEndWriter):
         self._writer.write(read1)
         self._writer.write(read2)
 
+    def _write_fastq(self, read1: SequenceRecord, read2: SequenceRecord) -> None:
+        """
+        Write both records of a pair directly to the FASTQ file, bypassing
+        the FastqWriter.write indirection.
+        """
+        self._file.write(read1.fastq_bytes())
+        self._file.write(read2.fastq_bytes())
+
     def close(self) -> None:
         self._writer.close()
 
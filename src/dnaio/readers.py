@@ -4,6 +4,7 @@ Classes for reading FASTA and FASTQ files
 __all__ = ["FastaReader", "FastqReader"]
 
 import io
+import os
 from os import PathLike
 from typing import Union, BinaryIO, Optional, Iterator, List
 
@@ -35,8 +36,8 @@ class BinaryFileReader:
         The file is a path or a file-like object. In both cases, the file may
         be compressed (.gz, .bz2, .xz, .zst).
         """
-        if isinstance(file, str):
-            self._file = opener(file, self.mode)
+        if isinstance(file, (str, PathLike)):
+            self._file = opener(os.fspath(file), self.mode)
             self._close_on_exit = True
         elif _close_file:
             self._close_on_exit = True
@@ -0,0 +1,110 @@
+#include "compiler.h"
+#include "_conversions.h"
+
+#include <stddef.h>
+
+static void
+reverse_complement_default(char *dest, const char *sequence, size_t length)
+{
+    char *dest_cursor = dest + length;
+    for (size_t i=0; i<length; i++) {
+        dest_cursor -= 1;
+        dest_cursor[0] = NUCLEOTIDE_COMPLEMENTS[(unsigned char)sequence[i]];
+    }
+}
+
+static void
+reverse_string_default(char *dest, const char *string, size_t length)
+{
+    char *dest_cursor = dest + length;
+    for (size_t i=0; i<length; i++) {
+        dest_cursor -= 1;
+        dest_cursor[0] = string[i];
+    }
+}
+
+static void (*reverse_complement)(
+    char *dest, const char *sequence, size_t length
+) = reverse_complement_default;
+
+static void (*reverse_string)(
+    char *dest, const char *string, size_t length
+) = reverse_string_default;
+
+#if COMPILER_HAS_TARGET && COMPILER_HAS_CONSTRUCTOR && BUILD_IS_X86_64
+__attribute__((__target__("ssse3")))
+static void
+reverse_complement_ssse3(char *dest, const char *sequence, size_t length)
+{
+    /* Only characters in 0x40-0x7F have a complement that differs from the
+       character itself. For those, character ^ complement only depends on
+       the five lowest bits, so two pshufb lookups on the low nibble (one for
+       characters with bit 0x10 unset and one with it set) give the XOR value
+       needed to complement 16 characters at once. See
+       generate_conversion_tables.py for how the tables are built. */
+    const __m128i reverse_shuffle = _mm_setr_epi8(
+        15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0);
+    const __m128i xor_low = _mm_loadu_si128(
+        (const __m128i *)NUCLEOTIDE_COMPLEMENTS_XOR_LOW);
+    const __m128i xor_high = _mm_loadu_si128(
+        (const __m128i *)NUCLEOTIDE_COMPLEMENTS_XOR_HIGH);
+    const __m128i low_nibble_mask = _mm_set1_epi8(0x0F);
+    const __m128i high_half_bit = _mm_set1_epi8(0x10);
+    const __m128i range_mask = _mm_set1_epi8((char)0xC0);
+    const __m128i letter_range = _mm_set1_epi8(0x40);
+    const char *sequence_cursor = sequence;
+    const char *sequence_vec_end_ptr = sequence + length - (sizeof(__m128i) - 1);
+    char *dest_cursor = dest + length;
+    while (sequence_cursor < sequence_vec_end_ptr) {
+        __m128i nucleotides = _mm_loadu_si128((const __m128i *)sequence_cursor);
+        __m128i low_nibbles = _mm_and_si128(nucleotides, low_nibble_mask);
+        __m128i in_high_half = _mm_cmpeq_epi8(
+            _mm_and_si128(nucleotides, high_half_bit), high_half_bit);
+        __m128i xor_values = _mm_or_si128(
+            _mm_andnot_si128(in_high_half, _mm_shuffle_epi8(xor_low, low_nibbles)),
+            _mm_and_si128(in_high_half, _mm_shuffle_epi8(xor_high, low_nibbles)));
+        __m128i is_letter = _mm_cmpeq_epi8(
+            _mm_and_si128(nucleotides, range_mask), letter_range);
+        __m128i complements = _mm_xor_si128(
+            nucleotides, _mm_and_si128(xor_values, is_letter));
+        dest_cursor -= sizeof(__m128i);
+        _mm_storeu_si128((__m128i *)dest_cursor,
+                         _mm_shuffle_epi8(complements, reverse_shuffle));
+        sequence_cursor += sizeof(__m128i);
+    }
+    reverse_complement_default(dest, sequence_cursor, dest_cursor - dest);
+}
+
+__attribute__((__target__("ssse3")))
+static void
+reverse_string_ssse3(char *dest, const char *string, size_t length)
+{
+    const __m128i reverse_shuffle = _mm_setr_epi8(
+        15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0);
+    const char *string_cursor = string;
+    const char *string_vec_end_ptr = string + length - (sizeof(__m128i) - 1);
+    char *dest_cursor = dest + length;
+    while (string_cursor < string_vec_end_ptr) {
+        __m128i characters = _mm_loadu_si128((const __m128i *)string_cursor);
+        dest_cursor -= sizeof(__m128i);
+        _mm_storeu_si128((__m128i *)dest_cursor,
+                         _mm_shuffle_epi8(characters, reverse_shuffle));
+        string_cursor += sizeof(__m128i);
+    }
+    reverse_string_default(dest, string_cursor, dest_cursor - dest);
+}
+
+/* Constructor functions run at dynamic link time. This checks the CPU capabilities
+   and updates the function pointers accordingly. */
+__attribute__((constructor))
+static void reverse_complement_dispatch(void) {
+    if (__builtin_cpu_supports("ssse3")) {
+        reverse_complement = reverse_complement_ssse3;
+        reverse_string = reverse_string_ssse3;
+    }
+    else {
+        reverse_complement = reverse_complement_default;
+        reverse_string = reverse_string_default;
+    }
+}
+#endif
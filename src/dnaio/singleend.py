@@ -1,10 +1,36 @@
 import os
-from typing import Optional, Union, BinaryIO, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, Optional, Union, BinaryIO, Tuple
 
 from .exceptions import UnknownFileFormat
 from .readers import BamReader, FastaReader, FastqReader
 from .writers import FastaWriter, FastqWriter
 
+# Classes to instantiate for each file format, depending on the mode
+_READERS: Dict[str, Callable[..., Union[BamReader, FastaReader, FastqReader]]] = {
+    "fasta": FastaReader,
+    "fastq": FastqReader,
+    "bam": BamReader,
+    "bam_no_header": partial(BamReader, with_header=False),
+}
+_WRITERS: Dict[str, Callable[..., Union[FastaWriter, FastqWriter]]] = {
+    "fasta": FastaWriter,
+    "fastq": FastqWriter,
+}
+
+# File formats for the file name extensions that can be auto-detected
+_FORMAT_FOR_EXTENSION = {
+    ".fasta": "fasta",
+    ".fa": "fasta",
+    ".fna": "fasta",
+    ".csfasta": "fasta",
+    ".csfa": "fasta",
+    ".fastq": "fastq",
+    ".fq": "fastq",
+    ".bam": "bam",
+}
+_COMPRESSION_EXTENSIONS = frozenset([".gz", ".xz", ".bz2", ".zst"])
+
 
 def _open_single(  # noqa: C901
     file_or_path: Union[str, os.PathLike, BinaryIO],
@@ -19,6 +45,8 @@ def _open_single(  # noqa: C901
     """
     if mode not in ("r", "w", "a"):
         raise ValueError("Mode must be 'r', 'w' or 'a'")
+    if mode != "r":
+        _check_output_format(file_or_path, fileformat)
 
     close_file, file, path = _open_file_or_path(file_or_path, mode, opener)
     del file_or_path
@@ -29,6 +57,8 @@ def _open_single(  # noqa: C901
         # Format not recognized, but we know whether to use a format with or without qualities
         fileformat = "fastq" if qualities else "fasta"
     if "r" in mode and fileformat is None:
+        # Only look at the file content if neither the fileformat argument nor
+        # the file name extension determined the format
         fileformat = _detect_format_from_content(file)
         if fileformat is None:
             name = getattr(file, "name", repr(file))
@@ -51,24 +81,9 @@ def _open_single(  # noqa: C901
             "Output format cannot be FASTQ since no quality values are available."
         )
 
-    if fileformat == "fasta":
-        if "r" in mode:
-            return FastaReader(file, _close_file=close_file)
-        return FastaWriter(file, _close_file=close_file)
-    elif fileformat == "fastq":
-        if "r" in mode:
-            return FastqReader(file, _close_file=close_file)
-        return FastqWriter(file, _close_file=close_file)
-    elif fileformat == "bam":
-        if "r" in mode:
-            return BamReader(file, _close_file=close_file)
-        # This should not be reached
-        raise NotImplementedError("Only reading is supported for BAM files")
-    elif fileformat == "bam_no_header":
-        if "r" in mode:
-            return BamReader(file, _close_file=close_file, with_header=False)
-        # This should not be reached
-        raise NotImplementedError("Only reading is supported for headerless BAM files")
+    constructor = (_READERS if "r" in mode else _WRITERS).get(fileformat)
+    if constructor is not None:
+        return constructor(file, _close_file=close_file)
     if close_file:
         file.close()
     raise UnknownFileFormat(
@@ -76,6 +91,28 @@ def _open_single(  # noqa: C901
     )
 
 
+def _check_output_format(
+    file_or_path: Union[str, os.PathLike, BinaryIO], fileformat: Optional[str]
+) -> None:
+    """
+    Raise ValueError if the given file format or the one detected from the
+    file name can only be read. This is checked before the file is opened
+    so that an existing file is not truncated.
+    """
+    if fileformat is None:
+        path: object
+        try:
+            path = os.fspath(file_or_path)  # type: ignore
+        except TypeError:
+            path = getattr(file_or_path, "name", None)
+        if not isinstance(path, str):
+            return
+        fileformat = _detect_format_from_name(path)
+    if fileformat in _READERS and fileformat not in _WRITERS:
+        # Only the BAM formats are read-only
+        raise ValueError("BAM output is not supported")
+
+
 def _open_file_or_path(
     file_or_path: Union[str, os.PathLike, BinaryIO], mode: str, opener
 ) -> Tuple[bool, BinaryIO, Optional[str]]:
@@ -101,25 +138,21 @@ def _open_file_or_path(
     return close_file, file, path
 
 
+@lru_cache(maxsize=1024)
 def _detect_format_from_name(name: str) -> Optional[str]:
     """
     name -- file name
 
-    Return 'fasta', 'fastq' or None if the format could not be detected.
+    Return 'fasta', 'fastq', 'bam' or None if the format could not be detected.
     """
-    name = name.lower()
-    for ext in (".gz", ".xz", ".bz2", ".zst"):
-        if name.endswith(ext):
-            name = name[: -len(ext)]
-            break
     name, ext = os.path.splitext(name)
-    if ext in [".fasta", ".fa", ".fna", ".csfasta", ".csfa"]:
-        return "fasta"
-    elif ext in [".fastq", ".fq"] or (ext == ".txt" and name.endswith("_sequence")):
+    ext = ext.lower()
+    if ext in _COMPRESSION_EXTENSIONS:
+        name, ext = os.path.splitext(name)
+        ext = ext.lower()
+    if ext == ".txt" and name.lower().endswith("_sequence"):
         return "fastq"
-    elif ext == "bam":
-        return "bam"
-    return None
+    return _FORMAT_FOR_EXTENSION.get(ext)
 
 
 def _detect_format_from_content(file: BinaryIO) -> Optional[str]:
@@ -6,7 +6,7 @@ from pytest import raises
 from io import BytesIO
 
 import dnaio
-from dnaio import UnknownFileFormat, FileFormatError
+from dnaio import UnknownFileFormat, FileFormatError, FastaFormatError
 from dnaio._core import paired_fastq_heads
 from dnaio.chunks import (
     _bam_head,
@@ -60,6 +60,13 @@ def test_paired_fasta_heads():
     assert pheads(b">r\nA\n>s", b">r") == (0, 0)
     assert pheads(b">r\nA\n>s", b">r\nCT\n>s") == (5, 6)
     assert pheads(b">r\nA\n>s\nG\n>t\n", b">r\nCT\n>s") == (5, 6)
+    assert pheads(b">r>x\nA\n>s", b">r\nCT\n>s") == (7, 6)
+    assert pheads(bytearray(b">r\nA\n>s"), b">r\nCT\n>s") == (5, 6)
+    with raises(FastaFormatError):
+        pheads(b"@r\nA\n>s", b">r\nCT\n>s")
+    assert _paired_fasta_heads(b">r\nA\n>s", b">r\nCT\n>s", -1, -1) == (5, 6)
+    assert _paired_fasta_heads(b">r\nA\n>s", b">r\nCT\n>s", -3, 100) == (0, 0)
+    assert _paired_fasta_heads(b"@r\nA\n>s", b">r\nCT\n>s", -100, -1) == (0, 0)
 
     buf1 = (
         textwrap.dedent(
@@ -130,6 +137,12 @@ def test_fastq_head():
     assert _fastq_head(b"A\nB\nC\nD\nE\nF\nG\nH\n") == 16
     assert _fastq_head(b"A\nB\nC\nD\nE\nF\nG\nH\nI") == 16
     assert _fastq_head(b"A\nB\nC\nD\nE\nF\nG\nH\nI\n") == 16
+    assert _fastq_head(b"A\nB\nC\nD\nE\nF\nG\nH\nI\n", 15) == 0
+    assert _fastq_head(bytearray(b"A\nB\nC\nD\nE\nF\nG\nH\nI\n"), 16) == 16
+    assert _fastq_head(b"A\nB\nC\nD\nE\nF\nG\nH\nI\n", -1) == 16
+    assert _fastq_head(b"A\nB\nC\nD\nE\nF\nG\nH\nI\n", -3) == 0
+    assert _fastq_head(b"A\nB\n", -100) == 0
+    assert _fastq_head(b"A\nB\nC\nD\nE\nF\nG\nH\n", 100) == 16
 
 
 def test_read_paired_chunks_empty_input(tmp_path):
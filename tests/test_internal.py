@@ -31,6 +31,7 @@ from dnaio import (
 )
 from dnaio.writers import FileWriter
 from dnaio.readers import BinaryFileReader
+from dnaio.singleend import _detect_format_from_name
 from dnaio._core import bytes_ascii_check
 
 TEST_DATA = Path(__file__).parent / "data"
@@ -343,6 +344,26 @@ class TestOpen:
         with dnaio.open(weird_path) as f:
             assert list(f) == simple_fastq
 
+    @mark.parametrize(
+        ["name", "expected"],
+        [
+            ("reads.fastq", "fastq"),
+            ("reads.FQ.gz", "fastq"),
+            ("path/to/s_1_sequence.txt.zst", "fastq"),
+            ("S_1_SEQUENCE.TXT.GZ", "fastq"),
+            ("Reads.FASTA", "fasta"),
+            ("other.txt", None),
+            ("reads.fa.bz2", "fasta"),
+            ("reads.csfasta.xz", "fasta"),
+            ("reads.bam", "bam"),
+            ("reads.gz", None),
+            ("reads.fastq.tar", None),
+            ("dir.fastq/reads", None),
+        ],
+    )
+    def test_detect_format_from_name(self, name, expected) -> None:
+        assert _detect_format_from_name(name) == expected
+
     def test_fastq_qualities_missing(self) -> None:
         path = os.path.join(self._tmpdir, "tmp.fastq")
         with raises(ValueError):
@@ -510,6 +531,17 @@ class TestPairedSequenceReader:
                 ),
             ] == list(psr)
 
+    def test_read_keep_pairs(self) -> None:
+        # Pairs that are still referenced must not be reused by the reader
+        with TwoFilePairedEndReader(
+            "tests/data/paired.1.fastq", "tests/data/paired.2.fastq"
+        ) as psr:
+            pairs = list(psr)
+        assert len(pairs) == 4
+        for i, (r1, r2) in enumerate(pairs, 1):
+            assert r1.id == f"read{i}/1"
+            assert r2.id == f"read{i}/2"
+
     def test_record_names_match(self) -> None:
         match = record_names_match
         assert match("abc", "abc")
@@ -631,6 +663,11 @@ def test_binary_file_reader() -> None:
     assert "operation on closed" in e.value.args[0]
 
 
+def test_binary_file_reader_pathlike() -> None:
+    with FastqReader(Path(SIMPLE_FASTQ)) as reader:
+        assert list(reader) == simple_fastq
+
+
 def test_fasta_writer_repr(tmp_path) -> None:
     with FastaWriter(tmp_path / "out.fasta") as fw:
         repr(fw)
@@ -195,6 +195,30 @@ def test_detect_bam_from_filename() -> None:
         assert record.name == "Myheader"
 
 
+@pytest.mark.filterwarnings("error::ResourceWarning")
+@pytest.mark.parametrize("mode", ["w", "a"])
+@pytest.mark.parametrize("nfiles", [1, 2, 3])
+def test_write_bam_not_supported(tmp_path, mode, nfiles) -> None:
+    paths = [tmp_path / f"out{i}.bam" for i in range(nfiles)]
+    for path in paths:
+        path.write_bytes(b"BAM\1data")
+    with pytest.raises(ValueError) as error:
+        dnaio.open(*paths, mode=mode)
+    error.match("BAM output is not supported")
+    for path in paths:
+        assert path.read_bytes() == b"BAM\1data"
+
+
+@pytest.mark.parametrize("fileformat", ["bam", "bam_no_header"])
+def test_write_bam_fileformat_not_supported(tmp_path, fileformat) -> None:
+    path = tmp_path / "out.fastq"
+    path.write_bytes(b"@r\nA\n+\n#\n")
+    with pytest.raises(ValueError) as error:
+        dnaio.open(path, mode="w", fileformat=fileformat)
+    error.match("BAM output is not supported")
+    assert path.read_bytes() == b"@r\nA\n+\n#\n"
+
+
 def test_read_raw_bam_no_header_from_memory() -> None:
     with open("tests/data/missing_header_no_bgzip_raw_bam_bytes", "rb") as f:
         raw_bam = f.read()
@@ -372,6 +396,19 @@ def test_no_file2_with_multiple_args() -> None:
     error.match("file2")
 
 
+def test_no_files() -> None:
+    with pytest.raises(ValueError) as error:
+        _ = dnaio.open()  # type: ignore
+    error.match("At least one file")
+
+
+def test_interleaved_none() -> None:
+    with dnaio.open("tests/data/simple.fastq", interleaved=None) as f:  # type: ignore
+        assert isinstance(f, dnaio.FastqReader)
+        records = list(f)
+    assert records == SIMPLE_RECORDS["fastq"]
+
+
 def test_no_multiple_files_interleaved() -> None:
     with pytest.raises(ValueError) as error:
         _ = dnaio.open(os.devnull, os.devnull, interleaved=True)  # type: ignore
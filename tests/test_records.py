@@ -20,6 +20,30 @@ class TestSequenceRecord:
             == b"@name\nACGT\n+name\n====\n"
         )
 
+    def test_fastq_bytes_after_update(self):
+        record = SequenceRecord("name", "ACGT", "====")
+        assert record.fastq_bytes() == b"@name\nACGT\n+\n====\n"
+        record.name = "other"
+        assert record.fastq_bytes() == b"@other\nACGT\n+\n====\n"
+        record.sequence = "TTTT"
+        assert record.fastq_bytes() == b"@other\nTTTT\n+\n====\n"
+        record.qualities = "####"
+        assert record.fastq_bytes() == b"@other\nTTTT\n+\n####\n"
+        assert record.fastq_bytes(two_headers=True) == b"@other\nTTTT\n+other\n####\n"
+
+    def test_fastq_bytes_after_reinit(self):
+        record = SequenceRecord("name", "ACGT", "====")
+        assert record.fastq_bytes() == b"@name\nACGT\n+\n====\n"
+        record.__init__("other", "TT", "##")
+        assert record.fastq_bytes() == b"@other\nTT\n+\n##\n"
+
+    def test_qualities_as_bytes(self):
+        assert SequenceRecord("name", "ACGT", "#=AF").qualities_as_bytes() == b"#=AF"
+
+    def test_qualities_as_bytes_none_qualities(self):
+        with pytest.raises(ValueError):
+            SequenceRecord("name", "ACGT").qualities_as_bytes()
+
     def test_is_mate_succes(self):
         assert SequenceRecord("name1", "A", "=").is_mate(
             SequenceRecord("name2", "GC", "FF")
@@ -36,6 +60,18 @@ class TestSequenceRecord:
             "/E///AEEEE/EEEEEEEEEEEE/E6/AAAA/",
         )
 
+    @pytest.mark.parametrize("length", [0, 1, 15, 16, 17, 31, 32, 33, 100])
+    def test_reverse_complement_all_ascii(self, length):
+        complements = str.maketrans(
+            "ACGTUMRWSYKVHDBNacgtumrwsykvhdbn", "TGCAAKYWSRMBDHVNtgcaakywsrmbdhvn"
+        )
+        ascii_chars = "".join(chr(i) for i in range(128))
+        sequence = (ascii_chars * 2)[:length]
+        qualities = "".join(chr(33 + i % 94) for i in range(length))
+        record = SequenceRecord("name", sequence, qualities).reverse_complement()
+        assert record.sequence == sequence.translate(complements)[::-1]
+        assert record.qualities == qualities[::-1]
+
     def test_reverse_complement_none_qualities(self):
         assert SequenceRecord(
             "name1", "GATTACA", None
@@ -155,7 +191,8 @@ class TestSequenceRecord:
 
 
 def test_legacy_sequence():
-    from dnaio import Sequence
+    with pytest.deprecated_call():
+        from dnaio import Sequence
 
     s = Sequence("name", "ACGT", "####")
     assert isinstance(s, SequenceRecord)